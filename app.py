@@ -1,18 +1,20 @@
-from flask import Flask, render_template, request, jsonify
+from flask import Blueprint, Flask, render_template, request, jsonify
 import os
 import json
 import sqlite3
+import threading
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from websockets.sync.client import connect
-from openai import OpenAI
 from medicaments_vocabulary import get_compact_speech_context
 
-app = Flask(__name__, template_folder='.')
+# Heavy third-party stacks (openai, websockets) are imported lazily inside the
+# functions that need them so that importing this module stays cheap.
 
-# Create uploads directory if it doesn't exist
+bp = Blueprint('main', __name__)
+
+# Uploads directory is created on first use, not at import time
 UPLOAD_FOLDER = 'uploads'
-os.makedirs(UPLOAD_FOLDER, exist_ok=True)
 
 # Soniox API configuration
 SONIOX_API_KEY = os.environ.get("SONIOX_API_KEY")
@@ -28,11 +30,25 @@ if not OPENAI_API_KEY:
     print("WARNING: OPENAI_API_KEY environment variable not set!")
     print("Please set it with: export OPENAI_API_KEY=<your_api_key>")
 
-openai_client = OpenAI(api_key=OPENAI_API_KEY) if OPENAI_API_KEY else None
+_openai_client = None
+_openai_lock = threading.Lock()
+
+def get_openai_client():
+    """Return the shared OpenAI client, constructing it on first use (None if no API key)"""
+    global _openai_client
+    if _openai_client is None and OPENAI_API_KEY:
+        with _openai_lock:
+            if _openai_client is None:
+                from openai import OpenAI
+                _openai_client = OpenAI(api_key=OPENAI_API_KEY)
+    return _openai_client
 
 # Database configuration
 DATABASE = 'questionnaire.db'
 
+_db_initialized = False
+_db_lock = threading.Lock()
+
 def init_db():
     """Initialize SQLite database with required tables"""
     conn = sqlite3.connect(DATABASE)
@@ -57,8 +73,53 @@ def init_db():
     conn.close()
     print("Database initialized successfully")
 
-# Initialize database on startup
-init_db()
+def get_db():
+    """Open a database connection, initializing the schema on first use"""
+    global _db_initialized
+    if not _db_initialized:
+        with _db_lock:
+            if not _db_initialized:
+                init_db()
+                _db_initialized = True
+    return sqlite3.connect(DATABASE)
+
+@lru_cache(maxsize=None)
+def get_speech_context():
+    """Build the Soniox speech context once and reuse it for every request"""
+    return get_compact_speech_context(boost_medicaments=20, boost_medical_terms=15)
+
+# Readiness state, filled in by the background warm-up
+_warmup_lock = threading.Lock()
+_warmup_thread = None
+_ready = threading.Event()
+_warmup_error = None
+
+def warm_up():
+    """Initialize the database, clients and caches ahead of the first real request"""
+    global _warmup_error
+    try:
+        conn = get_db()
+        conn.close()
+        os.makedirs(UPLOAD_FOLDER, exist_ok=True)
+        get_openai_client()
+        get_speech_context()
+        if SONIOX_API_KEY:
+            import websockets.sync.client  # noqa: F401
+        _warmup_error = None
+        _ready.set()
+        print("Warm-up complete")
+    except Exception as e:
+        _warmup_error = str(e)
+        print(f"Error during warm-up: {str(e)}")
+
+def start_warm_up():
+    """Start the background warm-up unless it is already running or done"""
+    global _warmup_thread
+    with _warmup_lock:
+        if _ready.is_set() or (_warmup_thread is not None and _warmup_thread.is_alive()):
+            return
+        _warmup_thread = threading.Thread(target=warm_up, name='warm-up', daemon=True)
+        _warmup_thread.start()
 
 def transcribe_with_soniox(audio_path: str, language: str = "ru") -> str:
     """
@@ -74,8 +135,10 @@ def transcribe_with_soniox(audio_path: str, language: str = "ru") -> str:
     if not SONIOX_API_KEY:
         raise RuntimeError("SONIOX_API_KEY is not set. Please set it as an environment variable.")
 
+    from websockets.sync.client import connect
+
     # Get medicament vocabulary for speech context
-    speech_context = get_compact_speech_context(boost_medicaments=20, boost_medical_terms=15)
+    speech_context = get_speech_context()
 
     # Soniox configuration
     config = {
@@ -132,15 +195,26 @@ def transcribe_with_soniox(audio_path: str, language: str = "ru") -> str:
         print(f"Transcription complete: {transcript}")
         return transcript
 
-@app.route('/')
+@bp.route('/ready')
+def ready():
+    """Readiness probe: kicks off the background warm-up and reports 503 until it finishes"""
+    if _ready.is_set():
+        return jsonify({'status': 'ready'})
+    start_warm_up()
+    body = {'status': 'warming'}
+    if _warmup_error:
+        body = {'status': 'error', 'error': _warmup_error}
+    return jsonify(body), 503
+
+@bp.route('/')
 def index():
     return render_template('index.html')
 
-@app.route('/questionnaire')
+@bp.route('/questionnaire')
 def questionnaire():
     return render_template('questionnaire.html')
 
-@app.route('/process-audio', methods=['POST'])
+@bp.route('/process-audio', methods=['POST'])
 def process_audio():
     try:
         if 'audio' not in request.files:
@@ -152,6 +226,7 @@ def process_audio():
         language = request.form.get('language', 'multi')
 
         # Save the audio file temporarily
+        os.makedirs(UPLOAD_FOLDER, exist_ok=True)
         audio_path = os.path.join(UPLOAD_FOLDER, 'recording.wav')
         audio_file.save(audio_path)
 
@@ -172,7 +247,7 @@ def process_audio():
         print(f"Error processing audio: {str(e)}")
         return jsonify({'error': str(e)}), 500
 
-@app.route('/get-ai-response', methods=['POST'])
+@bp.route('/get-ai-response', methods=['POST'])
 def get_ai_response():
     try:
         data = request.json
@@ -181,6 +256,7 @@ def get_ai_response():
         if not user_text:
             return jsonify({'error': 'No text provided'}), 400
 
+        openai_client = get_openai_client()
         if not openai_client:
             return jsonify({
                 'error': 'OpenAI API key not configured. Please set OPENAI_API_KEY environment variable.'
@@ -233,6 +309,10 @@ Provide your response in the following JSON format:
     "feedback": "<detailed feedback in Russian>"
 }}"""
 
+        openai_client = get_openai_client()
+        if not openai_client:
+            raise RuntimeError("OPENAI_API_KEY is not set. Please set it as an environment variable.")
+
         response = openai_client.chat.completions.create(
             model="gpt-4",
             messages=[
@@ -260,7 +340,7 @@ Provide your response in the following JSON format:
         print(f"Error getting AI feedback: {str(e)}")
         return 50, f"Ошибка при получении обратной связи: {str(e)}"
 
-@app.route('/submit-questionnaire', methods=['POST'])
+@bp.route('/submit-questionnaire', methods=['POST'])
 def submit_questionnaire():
     try:
         data = request.json
@@ -280,7 +360,7 @@ def submit_questionnaire():
         print(f"AI Feedback: {ai_feedback[:100]}...")
 
         # Save to database
-        conn = sqlite3.connect(DATABASE)
+        conn = get_db()
         cursor = conn.cursor()
 
         cursor.execute('''
@@ -315,11 +395,11 @@ def submit_questionnaire():
         print(f"Error submitting questionnaire: {str(e)}")
         return jsonify({'error': str(e)}), 500
 
-@app.route('/get-feedback/<int:response_id>', methods=['GET'])
+@bp.route('/get-feedback/<int:response_id>', methods=['GET'])
 def get_feedback(response_id):
     """Retrieve AI feedback for a specific response"""
     try:
-        conn = sqlite3.connect(DATABASE)
+        conn = get_db()
         cursor = conn.cursor()
 
         cursor.execute('''
@@ -353,6 +433,15 @@ def get_feedback(response_id):
         print(f"Error retrieving feedback: {str(e)}")
         return jsonify({'error': str(e)}), 500
 
+def create_app():
+    """Application factory: builds the Flask app without touching the database or API clients"""
+    app = Flask(__name__, template_folder='.')
+    app.register_blueprint(bp)
+    return app
+
+# Module-level app for `python app.py` and WSGI servers (e.g. `gunicorn app:app`)
+app = create_app()
+
 if __name__ == '__main__':
     print("=" * 50)
     print("Speech-to-Text AI Assistant (Soniox + GPT-4)")
@@ -367,6 +456,7 @@ if __name__ == '__main__':
     else:
         print("WARNING: OpenAI API key not set!")
         print("Set with: export OPENAI_API_KEY=<your_api_key>")
+    start_warm_up()
     print("Starting server...")
     print("Open your browser and go to: http://localhost:5000")
     print("=" * 50)
@@ -0,0 +1,88 @@
+"""
+Startup-time benchmark for app.py.
+
+Imports the app in fresh interpreters with `python -X importtime` and reports
+the total import time plus the slowest individual imports, so regressions in
+worker boot time are easy to spot.
+
+Usage:
+    python benchmark_startup.py                  # 5 runs, top 15 imports
+    python benchmark_startup.py --runs 10 --top 25
+    python benchmark_startup.py --budget-ms 300  # exit 1 if median exceeds budget
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def measure_import(module="app"):
+    """
+    Import a module in a fresh interpreter and collect -X importtime output.
+
+    Returns:
+        Tuple of (total_us, {imported module: cumulative_us})
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=APP_DIR,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{result.stderr}")
+
+    per_import = {}
+    for line in result.stderr.splitlines():
+        # Format: "import time: self [us] | cumulative | imported package"
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        per_import[name.strip()] = int(cumulative)
+
+    return per_import.get(module, 0), per_import
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark app.py import (worker boot) time")
+    parser.add_argument("--module", default="app", help="Module to import (default: app)")
+    parser.add_argument("--runs", type=int, default=5, help="Number of fresh-interpreter runs")
+    parser.add_argument("--top", type=int, default=15, help="Number of slowest imports to show")
+    parser.add_argument("--budget-ms", type=float, help="Fail if the median import time exceeds this")
+    args = parser.parse_args()
+
+    totals = []
+    samples = {}
+    for _ in range(args.runs):
+        total_us, per_import = measure_import(args.module)
+        totals.append(total_us)
+        for name, cumulative_us in per_import.items():
+            samples.setdefault(name, []).append(cumulative_us)
+
+    median_ms = statistics.median(totals) / 1000
+    print("=" * 50)
+    print(f"Import of '{args.module}' over {args.runs} runs")
+    print("=" * 50)
+    print(f"Median: {median_ms:.1f} ms")
+    print(f"Min:    {min(totals) / 1000:.1f} ms")
+    print(f"Max:    {max(totals) / 1000:.1f} ms")
+    print()
+    print(f"Slowest {args.top} imports (median cumulative):")
+    slowest = sorted(
+        ((statistics.median(values), name) for name, values in samples.items() if name != args.module),
+        reverse=True,
+    )[:args.top]
+    for cumulative_us, name in slowest:
+        print(f"  {cumulative_us / 1000:8.1f} ms  {name}")
+
+    if args.budget_ms is not None and median_ms > args.budget_ms:
+        print(f"\nFAIL: median {median_ms:.1f} ms exceeds budget of {args.budget_ms:.1f} ms")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()